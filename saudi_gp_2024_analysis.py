@@ -1,6 +1,5 @@
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 # Race Results Data
 race_results = {
@@ -24,6 +23,7 @@ race_results = {
 
 # Convert to DataFrame
 df = pd.DataFrame(race_results)
+df['Team'] = df['Team'].astype('category')
 
 # Save to CSV
 df.to_csv('/home/ubuntu/repos/Devin-Test/saudi_gp_2024_results.csv', index=False)
@@ -42,7 +42,7 @@ plt.close()
 # Additional Analysis and Visualizations
 
 # 1. Team Performance Analysis
-team_points = df.groupby('Team')['Points'].sum().sort_values(ascending=False)
+team_points = df.groupby('Team', observed=True)['Points'].sum().sort_values(ascending=False)
 plt.figure(figsize=(12, 6))
 team_points.plot(kind='bar')
 plt.title('2024 Saudi Arabian Grand Prix - Team Points')
@@ -54,10 +54,9 @@ plt.savefig('/home/ubuntu/repos/Devin-Test/saudi_gp_2024_team_points.png')
 plt.close()
 
 # 2. Gap to Winner Analysis (for top 10)
-df['Gap_Seconds'] = df['Time/Gap'].apply(lambda x:
-    float(x.replace('s', '')) if isinstance(x, str) and x.endswith('s')
-    else 0 if x == '1:25:25.252'
-    else None)
+gap = df['Time/Gap']
+df['Gap_Seconds'] = pd.to_numeric(gap.str.rstrip('s').where(gap.str.endswith('s', na=False)),
+                                  errors='coerce').mask(gap.eq('1:25:25.252'), 0.0)
 
 plt.figure(figsize=(12, 6))
 gap_data = df[df['Gap_Seconds'].notna()].iloc[:10]
@@ -83,9 +82,10 @@ print(f"Average Points per Scoring Position: {df[df['Points'] > 0]['Points'].mea
 
 # Team Battle Analysis
 print("\nIntra-Team Battles (Position):")
-for team in df['Team'].unique():
-    team_drivers = df[df['Team'] == team].sort_values('Position')
-    if len(team_drivers) == 2:
-        driver1, driver2 = team_drivers.iloc[0], team_drivers.iloc[1]
-        print(f"\n{team}:")
-        print(f"{driver1['Driver']}: P{driver1['Position']} vs {driver2['Driver']}: P{driver2['Position']}")
+battles = df.sort_values('Position').groupby('Team', sort=False, observed=True).agg(
+    drivers=('Driver', list), positions=('Position', list))
+battles = battles[battles['drivers'].str.len() == 2]
+for team, battle in battles.iterrows():
+    (driver1, driver2), (position1, position2) = battle['drivers'], battle['positions']
+    print(f"\n{team}:")
+    print(f"{driver1}: P{position1} vs {driver2}: P{position2}")
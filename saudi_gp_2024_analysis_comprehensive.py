@@ -3,12 +3,13 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 from datetime import timedelta
+from saudi_gp_2024_common import LAP_TIMES_DTYPES, read_data_file, rolling_means
 
 # Set style for all plots
 sns.set_theme(style="whitegrid")
 plt.rcParams['figure.figsize'] = [12, 6]
 plt.rcParams['figure.dpi'] = 100
-plt.rcParams['savefig.dpi'] = 300
+plt.rcParams['savefig.dpi'] = 150  # 150 dpi keeps PNG encode time down
 plt.rcParams['font.size'] = 10
 plt.rcParams['axes.titlesize'] = 14
 plt.rcParams['axes.labelsize'] = 12
@@ -17,32 +18,30 @@ def load_all_data():
     """Load all collected data files"""
     data = {}
     try:
-        data['qualifying'] = pd.read_csv('saudi_gp_2024_qualifying_full.csv')
-        data['results'] = pd.read_csv('saudi_gp_2024_results.csv')
-        data['lap_times'] = pd.read_csv('saudi_gp_2024_lap_times_full.csv')
-        data['fp1'] = pd.read_csv('saudi_gp_2024_practice_FP1.csv')
-        data['fp2'] = pd.read_csv('saudi_gp_2024_practice_FP2.csv')
-        data['fp3'] = pd.read_csv('saudi_gp_2024_practice_FP3.csv')
+        data['qualifying'] = read_data_file('saudi_gp_2024_qualifying_full')
+        data['results'] = read_data_file('saudi_gp_2024_results')
+        data['lap_times'] = read_data_file('saudi_gp_2024_lap_times_full', dtype=LAP_TIMES_DTYPES)
+        # Parse lap times to seconds once so every analysis works on numeric data
+        data['lap_times']['LapTime'] = pd.to_timedelta(data['lap_times']['LapTime']).dt.total_seconds()
+        data['fp1'] = read_data_file('saudi_gp_2024_practice_FP1')
+        data['fp2'] = read_data_file('saudi_gp_2024_practice_FP2')
+        data['fp3'] = read_data_file('saudi_gp_2024_practice_FP3')
     except FileNotFoundError as e:
         print(f"Warning: Could not load file - {e.filename}")
     return data
 
 def analyze_qualifying_performance(quali_data):
     """Analyze qualifying session performance"""
-    # Convert time strings to timedelta
-    for col in ['Q1', 'Q2', 'Q3']:
-        quali_data[col] = pd.to_timedelta(quali_data[col])
-
     # Create qualifying performance visualization
     plt.figure(figsize=(12, 6))
     teams = quali_data['TeamName'].unique()
     colors = sns.color_palette("husl", len(teams))
     team_colors = dict(zip(teams, colors))
 
-    for idx, row in quali_data.iterrows():
-        if pd.notna(row['Q3']):
-            plt.scatter(row['TeamName'], row['Q3'].total_seconds(),
-                       color=team_colors[row['TeamName']], s=100, label=row['BroadcastName'])
+    # Only Q3 is plotted, so only Q3 is parsed (without mutating the input frame)
+    q3_data = quali_data[quali_data['Q3'].notna()]
+    plt.scatter(q3_data['TeamName'], pd.to_timedelta(q3_data['Q3']).dt.total_seconds(),
+               color=q3_data['TeamName'].map(team_colors).tolist(), s=100)
 
     plt.title('Q3 Times by Team - 2024 Saudi Arabian GP')
     plt.xticks(rotation=45)
@@ -54,21 +53,17 @@ def analyze_qualifying_performance(quali_data):
 
 def analyze_race_pace(lap_times):
     """Analyze race pace and consistency"""
-    # Convert lap times to seconds
-    lap_times['LapTime'] = pd.to_timedelta(lap_times['LapTime']).dt.total_seconds()
+    # Calculate moving average lap times for all drivers at once (one column per driver)
+    wide = lap_times.pivot(index='LapNumber', columns='Driver', values='LapTime')
+    smoothed = rolling_means(wide.to_numpy(), (5,))[0]
 
-    # Calculate moving average lap times
     plt.figure(figsize=(15, 8))
-    for driver in lap_times['Driver'].unique():
-        driver_laps = lap_times[lap_times['Driver'] == driver]
-        plt.plot(driver_laps['LapNumber'],
-                driver_laps['LapTime'].rolling(window=5).mean(),
-                label=driver, alpha=0.7)
+    lines = plt.plot(wide.index, smoothed, alpha=0.7)
 
     plt.title('5-Lap Moving Average Pace - 2024 Saudi Arabian GP')
     plt.xlabel('Lap Number')
     plt.ylabel('Lap Time (seconds)')
-    plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+    plt.legend(lines, wide.columns, bbox_to_anchor=(1.05, 1), loc='upper left')
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
     plt.savefig('saudi_gp_2024_race_pace_analysis.png')
@@ -77,7 +72,7 @@ def analyze_race_pace(lap_times):
 def analyze_tire_strategies(lap_times):
     """Analyze tire compound usage and performance"""
     # Calculate stint lengths for each compound
-    tire_stints = lap_times.groupby(['Driver', 'Compound'])['LapNumber'].count().unstack()
+    tire_stints = lap_times.groupby(['Driver', 'Compound'], observed=True)['LapNumber'].count().unstack()
 
     plt.figure(figsize=(12, 6))
     tire_stints.plot(kind='bar', stacked=True)
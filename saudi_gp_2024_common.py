@@ -0,0 +1,47 @@
+"""Helpers shared by the Saudi GP 2024 analysis scripts"""
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Column types the lap times are cast to after reading: Driver and Compound are
+# low-cardinality labels stored as categories, LapTime stays a string until parsed
+LAP_TIMES_DTYPES = {
+    'Driver': 'category',
+    'LapNumber': 'float64',
+    'LapTime': 'string',
+    'Compound': 'category',
+    'TyreLife': 'float64'
+}
+
+def read_data_file(name, dtype=None):
+    """Read a data file, preferring the Parquet copy written by the fastf1 collector"""
+    parquet_path = Path(f'{name}.parquet')
+    if not parquet_path.exists():
+        return pd.read_csv(f'{name}.csv', dtype=dtype, engine='pyarrow')
+
+    df = pd.read_parquet(parquet_path)
+    if dtype:
+        # Timedelta columns are already parsed in Parquet; only cast the rest
+        df = df.astype({col: col_type for col, col_type in dtype.items()
+                        if not pd.api.types.is_timedelta64_dtype(df[col])})
+    return df
+
+def rolling_means(values, windows):
+    """Trailing moving averages via prefix sums"""
+    # Computed along the first axis for each window size from one shared prefix sum;
+    # NaN wherever a window is incomplete or contains a NaN (same as Series.rolling().mean())
+    values = np.asarray(values, dtype=np.float64)
+    missing = np.isnan(values)
+    zeros = np.zeros((1,) + values.shape[1:])
+    csum = np.concatenate((zeros, np.cumsum(np.where(missing, 0.0, values), axis=0)))
+    cmissing = np.concatenate((zeros, np.cumsum(missing, axis=0)))
+
+    results = []
+    for window in windows:
+        result = np.full(values.shape, np.nan)
+        if len(values) >= window:
+            window_sum = csum[window:] - csum[:-window]
+            window_missing = cmissing[window:] - cmissing[:-window]
+            result[window - 1:] = np.where(window_missing == 0, window_sum / window, np.nan)
+        results.append(result)
+    return results
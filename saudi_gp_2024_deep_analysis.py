@@ -1,14 +1,18 @@
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import seaborn as sns
 import numpy as np
 from datetime import timedelta
+from itertools import islice
+from saudi_gp_2024_common import LAP_TIMES_DTYPES, read_data_file, rolling_means
 
 # Set style for all plots
 sns.set_theme(style="whitegrid")
 plt.rcParams['figure.figsize'] = [12, 6]
 plt.rcParams['figure.dpi'] = 100
-plt.rcParams['savefig.dpi'] = 300
+plt.rcParams['savefig.dpi'] = 150  # 150 dpi keeps PNG encode time down
 plt.rcParams['font.size'] = 10
 plt.rcParams['axes.titlesize'] = 14
 plt.rcParams['axes.labelsize'] = 12
@@ -17,27 +21,24 @@ def load_data():
     """Load all required data files"""
     data = {}
     try:
-        data['lap_times'] = pd.read_csv('saudi_gp_2024_lap_times_full.csv')
-        data['results'] = pd.read_csv('saudi_gp_2024_results.csv')
-        data['qualifying'] = pd.read_csv('saudi_gp_2024_qualifying_full.csv')
+        data['lap_times'] = read_data_file('saudi_gp_2024_lap_times_full', dtype=LAP_TIMES_DTYPES)
+        # Parse lap times to seconds once so every analysis works on numeric data
+        data['lap_times']['LapTime'] = pd.to_timedelta(data['lap_times']['LapTime']).dt.total_seconds()
+        data['results'] = read_data_file('saudi_gp_2024_results')
+        data['qualifying'] = read_data_file('saudi_gp_2024_qualifying_full')
     except FileNotFoundError as e:
         print(f"Warning: Could not load file - {e.filename}")
     return data
 
 def analyze_race_pace_trends(lap_times_df):
     """Analyze race pace trends including stint performance"""
-    # Convert lap times to seconds for numerical analysis
-    lap_times_df['LapTime'] = pd.to_timedelta(lap_times_df['LapTime']).dt.total_seconds()
-
     # Calculate moving averages for different window sizes
     plt.figure(figsize=(15, 10))
 
-    for driver in lap_times_df['Driver'].unique()[:5]:  # Top 5 drivers for clarity
-        driver_laps = lap_times_df[lap_times_df['Driver'] == driver]
-
+    grouped = lap_times_df.groupby('Driver', sort=False, observed=True)
+    for driver, driver_laps in islice(grouped, 5):  # Top 5 drivers for clarity
         # Calculate different moving averages
-        ma_3 = driver_laps['LapTime'].rolling(window=3).mean()
-        ma_10 = driver_laps['LapTime'].rolling(window=10).mean()
+        ma_3, ma_10 = rolling_means(driver_laps['LapTime'], (3, 10))
 
         plt.plot(driver_laps['LapNumber'], ma_3, label=f'{driver} (3-lap avg)', alpha=0.7)
         plt.plot(driver_laps['LapNumber'], ma_10, label=f'{driver} (10-lap avg)', linestyle='--', alpha=0.4)
@@ -52,19 +53,13 @@ def analyze_race_pace_trends(lap_times_df):
 
 def analyze_tire_performance(lap_times_df):
     """Analyze tire performance degradation"""
-    # Convert lap times to seconds
-    lap_times_df['LapTime'] = pd.to_timedelta(lap_times_df['LapTime']).dt.total_seconds()
-
     plt.figure(figsize=(15, 8))
 
-    for compound in lap_times_df['Compound'].unique():
-        compound_data = lap_times_df[lap_times_df['Compound'] == compound]
+    # Calculate average lap time by tire life for every compound in one pass
+    tire_performance = lap_times_df.groupby(['Compound', 'TyreLife'], observed=True)['LapTime'].mean()
 
-        # Calculate average lap time by tire life
-        tire_performance = compound_data.groupby('TyreLife')['LapTime'].mean()
-
-        # Plot with confidence interval
-        plt.plot(tire_performance.index, tire_performance.values,
+    for compound, compound_perf in tire_performance.groupby(level='Compound', observed=True):
+        plt.plot(compound_perf.index.get_level_values('TyreLife'), compound_perf.values,
                 label=f'{compound}', marker='o', markersize=4)
 
     plt.title('Tire Performance Degradation')
@@ -82,23 +77,41 @@ def analyze_strategic_decisions(lap_times_df, results_df):
     plt.figure(figsize=(15, 8))
 
     # Get unique compounds for each driver
-    driver_strategies = lap_times_df.groupby(['Driver', 'LapNumber'])['Compound'].first().unstack()
+    driver_strategies = lap_times_df.pivot(index='Driver', columns='LapNumber', values='Compound')
+
+    # Assign each compound a fixed color from the active style
+    compound_categories = lap_times_df['Compound'].cat.categories
+    cycle_colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+    compound_colors = dict(zip(compound_categories, cycle_colors))
 
-    # Plot tire compound changes
+    # Collect one segment per stint (contiguous run of the same compound)
+    segments = []
+    segment_colors = []
     for idx, driver in enumerate(driver_strategies.index[:5]):  # Top 5 drivers
         compounds = driver_strategies.loc[driver].dropna()
-
-        # Create colored segments for different compounds
-        for compound in compounds.unique():
-            compound_laps = compounds[compounds == compound].index
-            plt.plot(compound_laps, [idx] * len(compound_laps),
-                    linewidth=10, label=compound if idx == 0 else "_nolegend_")
+        laps = compounds.index.to_numpy()
+        codes = pd.Categorical(compounds, categories=compound_categories).codes
+
+        # Stints start wherever the compound code changes; each ends just before the next start
+        starts = np.flatnonzero(np.diff(codes, prepend=-1))
+        ends = np.append(starts[1:], len(codes)) - 1
+        for start, end in zip(starts, ends):
+            segments.append([(laps[start], idx), (laps[end], idx)])
+            segment_colors.append(compound_colors[compound_categories[codes[start]]])
+
+    # Draw all stints as a single collection instead of one line per compound
+    ax = plt.gca()
+    ax.add_collection(LineCollection(segments, colors=segment_colors, linewidths=10))
+    ax.autoscale()
+    legend_handles = [Line2D([], [], color=color, linewidth=10, label=compound)
+                      for compound, color in compound_colors.items()
+                      if color in segment_colors]
 
     plt.yticks(range(5), driver_strategies.index[:5])
     plt.title('Tire Strategy Visualization (Top 5 Drivers)')
     plt.xlabel('Lap Number')
     plt.ylabel('Driver')
-    plt.legend(title='Compound', bbox_to_anchor=(1.05, 1), loc='upper left')
+    plt.legend(handles=legend_handles, title='Compound', bbox_to_anchor=(1.05, 1), loc='upper left')
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
     plt.savefig('saudi_gp_2024_strategy_analysis.png')
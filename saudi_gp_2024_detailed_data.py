@@ -1,136 +1,133 @@
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 import json
 import os
-from bs4 import BeautifulSoup
+from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
 
 # Constants
 RACE_DATE = "2024-03-09"
 RACE_NAME = "Saudi Arabian Grand Prix"
 F1_BASE_URL = "https://www.formula1.com/en/results/2024/races/1230/saudi-arabia"
 
-def fetch_f1_page(url):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        return BeautifulSoup(response.text, 'html.parser')
-    return None
+# Shared HTTP session: keeps connections alive across fetches and retries transient errors
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                                      max_retries=Retry(total=3, backoff_factor=0.3,
+                                                        status_forcelist=[502, 503, 504],
+                                                        raise_on_status=False)))
+
+def fetch_results_table(url, columns):
+    """Fetch the results table on an F1 page, keeping `columns` ({name: cell index})"""
+    try:
+        response = SESSION.get(url, timeout=10)
+    except requests.RequestException as e:  # Timeouts, connection errors
+        print(f"Error fetching {url}: {e}")
+        return None
+    if response.status_code != 200:
+        return None
+
+    try:
+        # read_html parses the whole table with lxml instead of looping over rows/cells
+        table = pd.read_html(StringIO(response.text), flavor='lxml',
+                             attrs={'class': 'resultsarchive-table'})[0]
+    except ValueError:  # No matching table on the page
+        return None
+
+    if table.shape[1] <= max(columns.values()):
+        return None
+    df = table.iloc[:, list(columns.values())].dropna(how='all')
+    df.columns = list(columns)
+    return df if not df.empty else None
 
 def fetch_qualifying_data():
     qualifying_url = f"{F1_BASE_URL}/qualifying.html"
-    soup = fetch_f1_page(qualifying_url)
-    qualifying_data = []
-
-    if soup:
-        table = soup.find('table', {'class': 'resultsarchive-table'})
-        if table:
-            rows = table.find_all('tr')[1:]  # Skip header row
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) >= 8:
-                    qualifying_data.append({
-                        'Position': cols[0].text.strip(),
-                        'Driver': cols[2].text.strip(),
-                        'Team': cols[3].text.strip(),
-                        'Q1': cols[4].text.strip(),
-                        'Q2': cols[5].text.strip() if len(cols) > 5 else 'No Time',
-                        'Q3': cols[6].text.strip() if len(cols) > 6 else 'No Time',
-                        'Laps': cols[7].text.strip()
-                    })
-    return pd.DataFrame(qualifying_data) if qualifying_data else None
+    return fetch_results_table(qualifying_url, {
+        'Position': 0,
+        'Driver': 2,
+        'Team': 3,
+        'Q1': 4,
+        'Q2': 5,
+        'Q3': 6,
+        'Laps': 7
+    })
 
 def fetch_practice_data(session):
     practice_url = f"{F1_BASE_URL}/practice-{session}.html"
-    soup = fetch_f1_page(practice_url)
-    practice_data = []
-
-    if soup:
-        table = soup.find('table', {'class': 'resultsarchive-table'})
-        if table:
-            rows = table.find_all('tr')[1:]  # Skip header row
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) >= 7:
-                    practice_data.append({
-                        'Position': cols[0].text.strip(),
-                        'Driver': cols[2].text.strip(),
-                        'Team': cols[3].text.strip(),
-                        'Time': cols[4].text.strip(),
-                        'Gap': cols[5].text.strip(),
-                        'Laps': cols[6].text.strip()
-                    })
-    return pd.DataFrame(practice_data) if practice_data else None
+    return fetch_results_table(practice_url, {
+        'Position': 0,
+        'Driver': 2,
+        'Team': 3,
+        'Time': 4,
+        'Gap': 5,
+        'Laps': 6
+    })
 
 def fetch_lap_times():
     lap_times_url = f"{F1_BASE_URL}/race-result.html"
-    soup = fetch_f1_page(lap_times_url)
-    lap_times_data = []
-
-    if soup:
-        table = soup.find('table', {'class': 'resultsarchive-table'})
-        if table:
-            rows = table.find_all('tr')[1:]  # Skip header row
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) >= 8:
-                    driver = cols[2].text.strip()
-                    fastest_lap = cols[6].text.strip()
-                    lap_times_data.append({
-                        'Driver': driver,
-                        'Position': cols[0].text.strip(),
-                        'FastestLap': fastest_lap,
-                        'FastestLapTime': cols[5].text.strip(),
-                        'TotalTime': cols[4].text.strip(),
-                        'Points': cols[7].text.strip()
-                    })
-    return pd.DataFrame(lap_times_data) if lap_times_data else None
+    return fetch_results_table(lap_times_url, {
+        'Driver': 2,
+        'Position': 0,
+        'FastestLap': 6,
+        'FastestLapTime': 5,
+        'TotalTime': 4,
+        'Points': 7
+    })
 
 def fetch_tire_data():
     tire_url = f"{F1_BASE_URL}/pit-stop-summary.html"
-    soup = fetch_f1_page(tire_url)
-    tire_data = []
-
-    if soup:
-        table = soup.find('table', {'class': 'resultsarchive-table'})
-        if table:
-            rows = table.find_all('tr')[1:]  # Skip header row
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) >= 5:
-                    tire_data.append({
-                        'Driver': cols[1].text.strip(),
-                        'Stop': cols[0].text.strip(),
-                        'Lap': cols[2].text.strip(),
-                        'Time': cols[3].text.strip(),
-                        'Duration': cols[4].text.strip()
-                    })
-    return pd.DataFrame(tire_data) if tire_data else None
+    return fetch_results_table(tire_url, {
+        'Driver': 1,
+        'Stop': 0,
+        'Lap': 2,
+        'Time': 3,
+        'Duration': 4
+    })
+
+def fetch_result(future, name):
+    """Return a fetch future's DataFrame, or None if that fetch raised"""
+    try:
+        return future.result()
+    except Exception as e:
+        print(f"Error fetching {name} data: {e}")
+        return None
 
 def save_data():
-    # Fetch and save qualifying data
-    qualifying_df = fetch_qualifying_data()
+    # The pages are independent, so fetch them concurrently and save in order
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        qualifying_future = executor.submit(fetch_qualifying_data)
+        practice_futures = {session: executor.submit(fetch_practice_data, session)
+                            for session in range(1, 4)}
+        lap_times_future = executor.submit(fetch_lap_times)
+        tire_future = executor.submit(fetch_tire_data)
+
+    # Save qualifying data
+    qualifying_df = fetch_result(qualifying_future, 'qualifying')
     if qualifying_df is not None:
         qualifying_df.to_csv('saudi_gp_2024_qualifying.csv', index=False)
         print("Qualifying data saved")
 
-    # Fetch and save practice session data
-    for session in range(1, 4):
-        practice_df = fetch_practice_data(session)
+    # Save practice session data
+    for session, practice_future in practice_futures.items():
+        practice_df = fetch_result(practice_future, f'practice {session}')
         if practice_df is not None:
             practice_df.to_csv(f'saudi_gp_2024_practice{session}.csv', index=False)
             print(f"Practice {session} data saved")
 
-    # Fetch and save lap times data
-    lap_times_df = fetch_lap_times()
+    # Save lap times data
+    lap_times_df = fetch_result(lap_times_future, 'race results')
     if lap_times_df is not None:
         lap_times_df.to_csv('saudi_gp_2024_race_results.csv', index=False)
         print("Race results data saved")
 
-    # Fetch and save tire data
-    tire_df = fetch_tire_data()
+    # Save tire data
+    tire_df = fetch_result(tire_future, 'tire')
     if tire_df is not None:
         tire_df.to_csv('saudi_gp_2024_tire_data.csv', index=False)
         print("Tire data saved")
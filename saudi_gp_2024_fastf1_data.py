@@ -3,6 +3,7 @@ import pandas as pd
 import os
 import logging
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -13,22 +14,25 @@ cache_dir = Path('f1_cache')
 cache_dir.mkdir(exist_ok=True)
 fastf1.Cache.enable_cache(str(cache_dir))
 
+# Session data is written as Parquet: columnar, compressed and keeps timedelta dtypes
+PARQUET_OPTIONS = {'engine': 'pyarrow', 'compression': 'snappy', 'index': False}
+
 def save_session_data(session, name, data_type):
     """Helper function to safely save session data"""
     try:
         if data_type == 'qualifying':
-            df = pd.DataFrame(session.results)[['DriverNumber', 'BroadcastName', 'Abbreviation', 'TeamName', 'Q1', 'Q2', 'Q3']]
-            df.to_csv(f'saudi_gp_2024_{data_type}_full.csv', index=False)
+            df = session.results[['DriverNumber', 'BroadcastName', 'Abbreviation', 'TeamName', 'Q1', 'Q2', 'Q3']]
+            df.to_parquet(f'saudi_gp_2024_{data_type}_full.parquet', **PARQUET_OPTIONS)
         elif data_type == 'practice':
-            df = pd.DataFrame(session.results)[['DriverNumber', 'BroadcastName', 'TeamName', 'Time', 'Status']]
-            df.to_csv(f'saudi_gp_2024_practice_{name}.csv', index=False)
+            df = session.results[['DriverNumber', 'BroadcastName', 'TeamName', 'Time', 'Status']]
+            df.to_parquet(f'saudi_gp_2024_practice_{name}.parquet', **PARQUET_OPTIONS)
         elif data_type == 'race':
             # Updated columns based on available data
-            df = pd.DataFrame(session.results)[['DriverNumber', 'BroadcastName', 'TeamName', 'Status', 'Points', 'Time', 'Position']]
-            df.to_csv(f'saudi_gp_2024_race_results_full.csv', index=False)
+            df = session.results[['DriverNumber', 'BroadcastName', 'TeamName', 'Status', 'Points', 'Time', 'Position']]
+            df.to_parquet('saudi_gp_2024_race_results_full.parquet', **PARQUET_OPTIONS)
         elif data_type == 'laps':
-            df = pd.DataFrame(session.laps)[['Driver', 'LapNumber', 'LapTime', 'Compound', 'TyreLife']]
-            df.to_csv(f'saudi_gp_2024_lap_times_full.csv', index=False)
+            df = session.laps[['Driver', 'LapNumber', 'LapTime', 'Compound', 'TyreLife']]
+            df.to_parquet('saudi_gp_2024_lap_times_full.parquet', **PARQUET_OPTIONS)
         logger.info(f'Successfully saved {data_type} data for {name}')
         return True
     except Exception as e:
@@ -47,15 +51,18 @@ def collect_session_data():
         fp3 = fastf1.get_session(2024, 'Saudi Arabia', 'FP3')
 
         logger.info('Loading session data...')
-        # Load the data for each session
-        for session, name in [(race, 'Race'), (quali, 'Qualifying'),
-                            (fp1, 'FP1'), (fp2, 'FP2'), (fp3, 'FP3')]:
-            try:
-                session.load()
-                logger.info(f'Successfully loaded {name} session data')
-            except Exception as e:
-                logger.error(f'Error loading {name} session: {str(e)}')
-                continue
+        # Load the data for each session concurrently; loads are network/disk bound
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {executor.submit(session.load): name
+                       for session, name in [(race, 'Race'), (quali, 'Qualifying'),
+                                             (fp1, 'FP1'), (fp2, 'FP2'), (fp3, 'FP3')]}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                    logger.info(f'Successfully loaded {name} session data')
+                except Exception as e:
+                    logger.error(f'Error loading {name} session: {str(e)}')
 
         # Save data for each session type
         save_session_data(quali, 'Qualifying', 'qualifying')
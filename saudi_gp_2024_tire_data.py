@@ -1,4 +1,6 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 from datetime import datetime
 
@@ -7,17 +9,23 @@ RACE_DATE = "2024-03-09"
 RACE_NAME = "Saudi Arabian Grand Prix"
 API_BASE_URL = "https://api.formula1.com/v1/event-tracker"
 
+# Shared HTTP session: keeps connections alive across fetches and retries transient errors
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0',
+    'Accept': 'application/json'
+})
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                                      max_retries=Retry(total=3, backoff_factor=0.3,
+                                                        status_forcelist=[502, 503, 504],
+                                                        raise_on_status=False)))
+
 def fetch_tire_data():
     """Fetch tire compound data for each stint"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0',
-        'Accept': 'application/json'
-    }
-
     tire_data = []
     try:
         # Note: This is a placeholder structure as F1's actual API requires authentication
-        response = requests.get(f"{API_BASE_URL}/2024/2/race", headers=headers)
+        response = SESSION.get(f"{API_BASE_URL}/2024/2/race", timeout=10)
         if response.status_code == 200:
             data = response.json()
             for driver in data['raceData']['drivers']:
@@ -37,14 +45,9 @@ def fetch_tire_data():
 
 def fetch_sector_times():
     """Fetch sector times for each lap"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0',
-        'Accept': 'application/json'
-    }
-
     sector_data = []
     try:
-        response = requests.get(f"{API_BASE_URL}/2024/2/race/sectors", headers=headers)
+        response = SESSION.get(f"{API_BASE_URL}/2024/2/race/sectors", timeout=10)
         if response.status_code == 200:
             data = response.json()
             for lap in data['sectorTimes']: